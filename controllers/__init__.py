@@ -253,20 +253,14 @@ class TopoController:
         """Bulk update that disables found links."""
         if not link_ids:
             return 0
-        ops = []
-        for _id in link_ids:
-            ops.append(
-                UpdateOne(
-                    {"_id": _id},
-                    {
-                        "$set":
-                        {
-                            "updated_at": datetime.utcnow(),
-                            "enabled": False,
-                        }
-                    }
-                )
-            )
+        update_expr = {
+            "$set":
+            {
+                "updated_at": datetime.utcnow(),
+                "enabled": False,
+            }
+        }
+        ops = [UpdateOne({"_id": _id}, update_expr) for _id in link_ids]
         return self.db.links.bulk_write(ops).modified_count
 
     def add_link_metadata(
@@ -6,6 +6,7 @@ Manage the network topology
 import pathlib
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import timezone
 from threading import Lock
 from typing import List, Optional
@@ -34,6 +35,11 @@ from .exceptions import RestoreError
 from .models import Topology
 
 DEFAULT_LINK_UP_TIMER = 10
+ENTITY_NAMES = {
+    Switch: ('switch', 'switches'),
+    Interface: ('interface', 'interfaces'),
+    Link: ('link', 'links'),
+}
 
 
 class Main(KytosNApp):  # pylint: disable=too-many-public-methods
@@ -57,9 +63,13 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
         self._intfs_lock = defaultdict(Lock)
         self._intfs_updated_at = {}
         self._intfs_tags_updated_at = {}
+        self._intfs_by_id: dict[str, Interface] = {}
         self.link_up = set()
         self.link_status_lock = Lock()
         self._switch_lock = defaultdict(Lock)
+        # to coalesce switch upserts that haven't been handled yet
+        self._switches_upsert_lock = Lock()
+        self._switches_upsert_pending = set()
         self.topo_controller = self.get_topo_controller()
         Link.register_status_func(f"{self.napp_id}_link_up_timer",
                                   self.link_status_hook_link_up_timer)
@@ -104,33 +114,68 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
     def _get_switches_dict(self):
         """Return a dictionary with the known switches."""
         switches = {'switches': {}}
-        for idx, switch in enumerate(self.controller.switches.copy().values()):
+        for idx, switch in enumerate(tuple(self.controller.switches.values())):
             switch_data = switch.as_dict()
-            if not all(key in switch_data['metadata']
-                       for key in ('lat', 'lng')):
+            metadata = switch_data['metadata']
+            if 'lat' not in metadata or 'lng' not in metadata:
                 # Switches are initialized somewhere in the ocean
-                switch_data['metadata']['lat'] = str(0.0)
-                switch_data['metadata']['lng'] = str(-30.0+idx*10.0)
+                metadata['lat'] = str(0.0)
+                metadata['lng'] = str(-30.0+idx*10.0)
             switches['switches'][switch.id] = switch_data
         return switches
 
     def _get_links_dict(self):
         """Return a dictionary with the known links."""
         return {'links': {link.id: link.as_dict() for link in
-                          self.links.copy().values()}}
+                          tuple(self.links.values())}}
 
     def _get_topology_dict(self):
         """Return a dictionary with the known topology."""
-        return {'topology': {**self._get_switches_dict(),
-                             **self._get_links_dict()}}
+        topology = self._get_switches_dict()
+        topology.update(self._get_links_dict())
+        return {'topology': topology}
 
     def _get_topology(self):
         """Return an object representing the topology."""
         return Topology(self.controller.switches.copy(), self.links.copy())
 
+    def _get_interface(self, interface_id: str) -> Interface:
+        """Get an interface by its id or raise HTTPException.
+
+        Interfaces are indexed by id as they get created or loaded, so
+        parsing the id is only needed on an index miss.
+        """
+        interface = self._intfs_by_id.get(interface_id)
+        if interface is not None:
+            switch = interface.switch
+            if (
+                self.controller.switches.get(switch.id) is switch
+                and switch.interfaces.get(interface.port_number) is interface
+            ):
+                return interface
+            self._intfs_by_id.pop(interface_id, None)
+
+        switch_id, _, port_number = interface_id.rpartition(":")
+        try:
+            port_number = int(port_number)
+        except ValueError:
+            detail = f"Invalid interface_id {interface_id}"
+            raise HTTPException(400, detail=detail)
+        try:
+            switch = self.controller.switches[switch_id]
+        except KeyError:
+            raise HTTPException(404, detail="Switch not found")
+        try:
+            interface = switch.interfaces[port_number]
+        except KeyError:
+            raise HTTPException(404, detail="Interface not found")
+
+        self._intfs_by_id[interface_id] = interface
+        return interface
+
     def _get_link_from_interface(self, interface: Interface):
         """Return the link of the interface, or None if it does not exist."""
-        for link in list(self.links.values()):
+        for link in tuple(self.links.values()):
             if interface in (link.endpoint_a, link.endpoint_b):
                 return link
         return None
@@ -171,9 +216,10 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
         interface_a.nni = True
         interface_b.nni = True
 
-    def _load_switch(self, switch_id, switch_att):
+    def _load_switch(self, switch_id, switch_att, switch=None):
         log.info(f'Loading switch dpid: {switch_id}')
-        switch = self.controller.get_switch_or_create(switch_id)
+        if switch is None:
+            switch = self.controller.get_switch_or_create(switch_id)
         if switch_att['enabled']:
             switch.enable()
         else:
@@ -199,6 +245,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
             interface.lldp = iface_att['lldp']
             interface.extend_metadata(iface_att["metadata"])
             interface.deactivate()
+            self._intfs_by_id[interface.id] = interface
             name = 'kytos/topology.port.created'
             event = KytosEvent(name=name, content={
                                               'switch': switch_id,
@@ -213,8 +260,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
 
         intf_ids = [v["id"] for v in switch_att.get("interfaces", {}).values()]
         intf_details = self.topo_controller.get_interfaces_details(intf_ids)
-        with self._links_lock:
-            self.load_interfaces_tags_values(switch, intf_details)
+        self.load_interfaces_tags_values(switch, intf_details)
 
     # pylint: disable=attribute-defined-outside-init
     def load_topology(self):
@@ -225,12 +271,26 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
 
         failed_switches = {}
         log.debug(f"_load_network_status switches={switches}")
-        for switch_id, switch_att in switches.items():
-            try:
-                self._load_switch(switch_id, switch_att)
-            except (KeyError, AttributeError, TypeError) as err:
-                failed_switches[switch_id] = err
-                log.error(f'Error loading switch: {err}')
+        # Switches are created upfront to keep the DB ordering, the rest of
+        # each switch loading is independent and mostly waiting on the DB
+        created = {
+            switch_id: self.controller.get_switch_or_create(switch_id)
+            for switch_id in switches
+        }
+        with ThreadPoolExecutor() as executor:
+            futures = {
+                executor.submit(
+                    self._load_switch, switch_id, switch_att,
+                    created[switch_id]
+                ): switch_id
+                for switch_id, switch_att in switches.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except (KeyError, AttributeError, TypeError) as err:
+                    failed_switches[futures[future]] = err
+                    log.error(f'Error loading switch: {err}')
 
         failed_links = {}
         log.debug(f"_load_network_status links={links}")
@@ -288,7 +348,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
         try:
             switch = self.controller.switches[dpid]
             link_ids = set()
-            for _, interface in switch.interfaces.copy().items():
+            for interface in tuple(switch.interfaces.values()):
                 if (interface.link and interface.link.is_enabled()):
                     link_ids.add(interface.link.id)
                     interface.link.disable()
@@ -322,7 +382,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
                     raise HTTPException(
                         409, detail="Switch should be disabled."
                     )
-                for intf_id, interface in switch.interfaces.copy().items():
+                for intf_id, interface in tuple(switch.interfaces.items()):
                     if not interface.all_tags_available():
                         detail = f"Interface {intf_id} vlans are being used."\
                                  " Delete any service using vlans."
@@ -346,6 +406,8 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
                     raise HTTPException(409, detail="Switch has flows. Verify"
                                                     " if a switch is used.")
                 switch = self.controller.switches.pop(dpid)
+                for interface in tuple(switch.interfaces.values()):
+                    self._intfs_by_id.pop(interface.id, None)
                 self.topo_controller.delete_switch_data(dpid)
         except KeyError:
             raise HTTPException(404, detail="Switch not found.")
@@ -404,12 +466,11 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
     @rest('v3/interfaces')
     def get_interfaces(self, _request: Request) -> JSONResponse:
         """Return a json with all the interfaces in the topology."""
-        interfaces = {}
-        switches = self._get_switches_dict()
-        for switch in switches['switches'].values():
-            for interface_id, interface in switch['interfaces'].items():
-                interfaces[interface_id] = interface
-
+        interfaces = {
+            interface.id: interface.as_dict()
+            for switch in tuple(self.controller.switches.values())
+            for interface in tuple(switch.interfaces.values())
+        }
         return JSONResponse({'interfaces': interfaces})
 
     @rest('v3/interfaces/switch/{dpid}/enable', methods=['POST'])
@@ -418,30 +479,25 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
         """Administratively enable interfaces in the topology."""
         interface_enable_id = request.path_params.get("interface_enable_id")
         dpid = request.path_params.get("dpid")
-        if dpid is None:
-            dpid = ":".join(interface_enable_id.split(":")[:-1])
-        try:
-            switch = self.controller.switches[dpid]
-            if not switch.is_enabled():
-                raise HTTPException(409, detail="Enable Switch first")
-        except KeyError:
-            raise HTTPException(404, detail="Switch not found")
-
         if interface_enable_id:
-            interface_number = int(interface_enable_id.split(":")[-1])
-
+            interface = self._get_interface(interface_enable_id)
+            switch = interface.switch
+        else:
             try:
-                interface = switch.interfaces[interface_number]
-                self.topo_controller.enable_interface(interface.id)
-                interface.enable()
-                self.notify_interface_link_status(interface, "link enabled")
+                switch = self.controller.switches[dpid]
             except KeyError:
-                msg = f"Switch {dpid} interface {interface_number} not found"
-                raise HTTPException(404, detail=msg)
+                raise HTTPException(404, detail="Switch not found")
+        if not switch.is_enabled():
+            raise HTTPException(409, detail="Enable Switch first")
+
+        if interface_enable_id:
+            self.topo_controller.enable_interface(interface.id)
+            interface.enable()
+            self.notify_interface_link_status(interface, "link enabled")
         else:
-            for interface in switch.interfaces.copy().values():
+            for interface in tuple(switch.interfaces.values()):
                 interface.enable()
-                self.notify_interface_link_status(interface, "link enabled")
+            self.notify_switch_links_status(switch, "link enabled")
             self.topo_controller.upsert_switch(switch.id, switch.as_dict())
         self.notify_topology_update()
         return JSONResponse("Operation successful")
@@ -452,37 +508,28 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
         """Administratively disable interfaces in the topology."""
         interface_disable_id = request.path_params.get("interface_disable_id")
         dpid = request.path_params.get("dpid")
-        if dpid is None:
-            dpid = ":".join(interface_disable_id.split(":")[:-1])
-        try:
-            switch = self.controller.switches[dpid]
-        except KeyError:
-            raise HTTPException(404, detail="Switch not found")
-
         if interface_disable_id:
-            interface_number = int(interface_disable_id.split(":")[-1])
-
+            interface = self._get_interface(interface_disable_id)
+            self.topo_controller.disable_interface(interface.id)
+            if interface.link and interface.link.is_enabled():
+                self.topo_controller.disable_link(interface.link.id)
+                interface.link.disable()
+                self.notify_link_enabled_state(interface.link, "disabled")
+            interface.disable()
+            self.notify_interface_link_status(interface, "link disabled")
+        else:
             try:
-                interface = switch.interfaces[interface_number]
-                self.topo_controller.disable_interface(interface.id)
-                if interface.link and interface.link.is_enabled():
-                    self.topo_controller.disable_link(interface.link.id)
-                    interface.link.disable()
-                    self.notify_link_enabled_state(interface.link, "disabled")
-                interface.disable()
-                self.notify_interface_link_status(interface, "link disabled")
+                switch = self.controller.switches[dpid]
             except KeyError:
-                msg = f"Switch {dpid} interface {interface_number} not found"
-                raise HTTPException(404, detail=msg)
-        else:
+                raise HTTPException(404, detail="Switch not found")
             link_ids = set()
-            for interface in switch.interfaces.copy().values():
+            for interface in tuple(switch.interfaces.values()):
                 if interface.link and interface.link.is_enabled():
                     link_ids.add(interface.link.id)
                     interface.link.disable()
                     self.notify_link_enabled_state(interface.link, "disabled")
                 interface.disable()
-                self.notify_interface_link_status(interface, "link disabled")
+            self.notify_switch_links_status(switch, "link disabled")
             self.topo_controller.bulk_disable_links(link_ids)
             self.topo_controller.upsert_switch(switch.id, switch.as_dict())
         self.notify_topology_update()
@@ -492,18 +539,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
     def get_interface_metadata(self, request: Request) -> JSONResponse:
         """Get metadata from an interface."""
         interface_id = request.path_params["interface_id"]
-        switch_id = ":".join(interface_id.split(":")[:-1])
-        interface_number = int(interface_id.split(":")[-1])
-        try:
-            switch = self.controller.switches[switch_id]
-        except KeyError:
-            raise HTTPException(404, detail="Switch not found")
-
-        try:
-            interface = switch.interfaces[interface_number]
-        except KeyError:
-            raise HTTPException(404, detail="Interface not found")
-
+        interface = self._get_interface(interface_id)
         return JSONResponse({"metadata": interface.metadata})
 
     @rest('v3/interfaces/{interface_id}/metadata', methods=['POST'])
@@ -511,19 +547,8 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
         """Add metadata to an interface."""
         interface_id = request.path_params["interface_id"]
         metadata = self._get_metadata(request)
-        switch_id = ":".join(interface_id.split(":")[:-1])
-        interface_number = int(interface_id.split(":")[-1])
-        try:
-            switch = self.controller.switches[switch_id]
-        except KeyError:
-            raise HTTPException(404, detail="Switch not found")
-
-        try:
-            interface = switch.interfaces[interface_number]
-            self.topo_controller.add_interface_metadata(interface.id, metadata)
-        except KeyError:
-            raise HTTPException(404, detail="Interface not found")
-
+        interface = self._get_interface(interface_id)
+        self.topo_controller.add_interface_metadata(interface.id, metadata)
         interface.extend_metadata(metadata)
         self.notify_metadata_changes(interface, 'added')
         return JSONResponse("Operation successful", status_code=201)
@@ -533,22 +558,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
         """Delete metadata from an interface."""
         interface_id = request.path_params["interface_id"]
         key = request.path_params["key"]
-        switch_id = ":".join(interface_id.split(":")[:-1])
-        try:
-            interface_number = int(interface_id.split(":")[-1])
-        except ValueError:
-            detail = f"Invalid interface_id {interface_id}"
-            raise HTTPException(400, detail=detail)
-
-        try:
-            switch = self.controller.switches[switch_id]
-        except KeyError:
-            raise HTTPException(404, detail="Switch not found")
-
-        try:
-            interface = switch.interfaces[interface_number]
-        except KeyError:
-            raise HTTPException(404, detail="Interface not found")
+        interface = self._get_interface(interface_id)
 
         try:
             _ = interface.metadata[key]
@@ -624,8 +634,8 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
         """Get all tag_ranges, available_tags, special_tags
          and special_available_tags from interfaces"""
         result = {}
-        for switch in self.controller.switches.copy().values():
-            for interface in switch.interfaces.copy().values():
+        for switch in tuple(self.controller.switches.values()):
+            for interface in tuple(switch.interfaces.values()):
                 result[interface.id] = {
                     "available_tags": interface.available_tags,
                     "tag_ranges": interface.tag_ranges,
@@ -681,10 +691,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
                     self.notify_link_enabled_state(link, "enabled")
         except KeyError:
             raise HTTPException(404, detail="Link not found")
-        self.notify_link_status_change(
-            self.links[link_id],
-            reason='link enabled'
-        )
+        self.notify_link_status_change(link, reason='link enabled')
         self.notify_topology_update()
         return JSONResponse("Operation successful", status_code=201)
 
@@ -701,10 +708,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
                     self.notify_link_enabled_state(link, "disabled")
         except KeyError:
             raise HTTPException(404, detail="Link not found")
-        self.notify_link_status_change(
-            self.links[link_id],
-            reason='link disabled'
-        )
+        self.notify_link_status_change(link, reason='link disabled')
         self.notify_topology_update()
         return JSONResponse("Operation successful", status_code=201)
 
@@ -801,20 +805,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
     def delete_interface(self, request: Request) -> JSONResponse:
         """Delete an interface only if it is not used."""
         intf_id = request.path_params.get("intf_id")
-        intf_split = intf_id.split(":")
-        switch_id = ":".join(intf_split[:-1])
-        try:
-            intf_port = int(intf_split[-1])
-        except ValueError:
-            raise HTTPException(400, detail="Invalid interface id.")
-        try:
-            switch = self.controller.switches[switch_id]
-        except KeyError:
-            raise HTTPException(404, detail="Switch not found.")
-        try:
-            interface = switch.interfaces[intf_port]
-        except KeyError:
-            raise HTTPException(404, detail="Interface not found.")
+        interface = self._get_interface(intf_id)
 
         usage = self.get_intf_usage(interface)
         if usage:
@@ -826,14 +817,14 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
     @listen_to("kytos/.*.liveness.(up|down)")
     def on_link_liveness_status(self, event) -> None:
         """Handle link liveness up|down status event."""
-        link = Link(event.content["interface_a"], event.content["interface_b"])
-        try:
-            link = self.links[link.id]
-        except KeyError:
-            log.error(f"Link id {link.id} not found, {link}")
+        new_link = Link(event.content["interface_a"],
+                        event.content["interface_b"])
+        link = self.links.get(new_link.id)
+        if link is None:
+            log.error(f"Link id {new_link.id} not found, {new_link}")
             return
         liveness_status = event.name.split(".")[-1]
-        self.handle_link_liveness_status(self.links[link.id], liveness_status)
+        self.handle_link_liveness_status(link, liveness_status)
 
     def handle_link_liveness_status(self, link, liveness_status) -> None:
         """Handle link liveness."""
@@ -855,15 +846,14 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
 
     def get_links_from_interfaces(self, interfaces) -> dict:
         """Get links from interfaces."""
+        intf_ids = {interface.id for interface in interfaces}
         links_found = {}
-        with self._links_lock:
-            for interface in interfaces:
-                for link in self.links.values():
-                    if any((
-                        interface.id == link.endpoint_a.id,
-                        interface.id == link.endpoint_b.id,
-                    )):
-                        links_found[link.id] = link
+        for link in tuple(self.links.values()):
+            if (
+                link.endpoint_a.id in intf_ids
+                or link.endpoint_b.id in intf_ids
+            ):
+                links_found[link.id] = link
         return links_found
 
     def handle_link_liveness_disabled(self, interfaces) -> None:
@@ -947,6 +937,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
         self.topo_controller.upsert_switch(switch.id, switch.as_dict())
         name = "kytos/topology.switch.interface.created"
         for interface in interfaces:
+            self._intfs_by_id[interface.id] = interface
             event = KytosEvent(name=name, content={'interface': interface})
             self.controller.buffers.app.put(event)
 
@@ -957,6 +948,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
         created event again and it can be belong to a link.
         """
         interface = event.content['interface']
+        self._intfs_by_id[interface.id] = interface
         if not interface.is_active():
             self.handle_interface_link_down(interface, event)
         else:
@@ -1027,7 +1019,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
     def get_flow_id_by_intf(self, interface: Interface) -> str:
         """Return flow_id from first found flow used by interface."""
         flows = self.get_flows_by_switch(interface.switch.id)
-        port_n = int(interface.id.split(":")[-1])
+        port_n = interface.port_number
         for flow in flows:
             in_port = flow["flow"].get("match", {}).get("in_port")
             if in_port == port_n:
@@ -1054,6 +1046,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
          it was confirmed that the interface is not used."""
         switch: Switch = interface.switch
         switch.remove_interface(interface)
+        self._intfs_by_id.pop(interface.id, None)
         self.topo_controller.upsert_switch(switch.id, switch.as_dict())
         self.topo_controller.delete_interface_from_details(interface.id)
 
@@ -1237,6 +1230,8 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
 
     def handle_topo_controller_upsert_switch(self, switch) -> Optional[dict]:
         """Handle topo_controller_upsert_switch."""
+        with self._switches_upsert_lock:
+            self._switches_upsert_pending.discard(switch.id)
         return self.topo_controller.upsert_switch(switch.id, switch.as_dict())
 
     def handle_lldp_status_updated(self, event) -> None:
@@ -1245,15 +1240,24 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
         interface_ids = content["interface_ids"]
         switches = set()
         for interface_id in interface_ids:
-            dpid = ":".join(interface_id.split(":")[:-1])
+            dpid = interface_id.rpartition(":")[0]
             switch = self.controller.get_switch_by_dpid(dpid)
             if switch:
                 switches.add(switch)
 
         name = "kytos/topology.topo_controller.upsert_switch"
         for switch in switches:
+            with self._switches_upsert_lock:
+                if switch.id in self._switches_upsert_pending:
+                    continue
+                self._switches_upsert_pending.add(switch.id)
             event = KytosEvent(name=name, content={"switch": switch})
-            self.controller.buffers.app.put(event)
+            try:
+                self.controller.buffers.app.put(event)
+            except Exception:
+                with self._switches_upsert_lock:
+                    self._switches_upsert_pending.discard(switch.id)
+                raise
 
     def notify_switch_enabled(self, dpid):
         """Send an event to notify that a switch is enabled."""
@@ -1263,16 +1267,20 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
 
     def notify_switch_links_status(self, switch, reason):
         """Send an event to notify the status of a link in a switch"""
+        name = 'kytos/topology.notify_link_up_if_status'
         with self._links_lock:
-            for link in self.links.values():
-                if switch in (link.endpoint_a.switch, link.endpoint_b.switch):
-                    if reason == "link enabled":
-                        name = 'kytos/topology.notify_link_up_if_status'
-                        content = {'reason': reason, "link": link}
-                        event = KytosEvent(name=name, content=content)
-                        self.controller.buffers.app.put(event)
-                    else:
-                        self.notify_link_status_change(link, reason)
+            links = [
+                link for link in self.links.values()
+                if switch in (link.endpoint_a.switch, link.endpoint_b.switch)
+            ]
+        for link in links:
+            if reason == "link enabled":
+                content = {'reason': reason, "link": link}
+                self.controller.buffers.app.put(
+                    KytosEvent(name=name, content=content)
+                )
+            else:
+                self.notify_link_status_change(link, reason)
 
     def notify_switch_disabled(self, dpid):
         """Send an event to notify that a switch is disabled."""
@@ -1305,49 +1313,37 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
          a link."""
         link_id = link.id
         with self.link_status_lock:
-            if (
-                (not link.status_reason and link.status == EntityStatus.UP)
-                and link_id not in self.link_up
-            ):
+            is_up = not link.status_reason and link.status == EntityStatus.UP
+            if is_up and link_id not in self.link_up:
                 self.link_up.add(link_id)
-                event = KytosEvent(
-                    name='kytos/topology.link_up',
-                    content={
-                        'link': link,
-                        'reason': reason
-                    },
-                )
-            elif (
-                (link.status_reason or link.status != EntityStatus.UP)
-                and link_id in self.link_up
-            ):
+                name = 'kytos/topology.link_up'
+            elif not is_up and link_id in self.link_up:
                 self.link_up.remove(link_id)
-                event = KytosEvent(
-                    name='kytos/topology.link_down',
-                    content={
-                        'link': link,
-                        'reason': reason
-                    },
-                )
+                name = 'kytos/topology.link_down'
             else:
                 return
+        event = KytosEvent(
+            name=name,
+            content={
+                'link': link,
+                'reason': reason
+            },
+        )
         self.controller.buffers.app.put(event)
 
     def notify_metadata_changes(self, obj, action):
         """Send an event to notify about metadata changes."""
-        if isinstance(obj, Switch):
-            entity = 'switch'
-            entities = 'switches'
-        elif isinstance(obj, Interface):
-            entity = 'interface'
-            entities = 'interfaces'
-        elif isinstance(obj, Link):
-            entity = 'link'
-            entities = 'links'
-        else:
-            raise ValueError(
-                'Invalid object, supported: Switch, Interface, Link'
-            )
+        try:
+            entity, entities = ENTITY_NAMES[obj.__class__]
+        except KeyError:
+            for cls, names in ENTITY_NAMES.items():
+                if isinstance(obj, cls):
+                    entity, entities = names
+                    break
+            else:
+                raise ValueError(
+                    'Invalid object, supported: Switch, Interface, Link'
+                )
 
         name = f'kytos/topology.{entities}.metadata.{action}'
         content = {entity: obj, 'metadata': obj.metadata.copy()}
@@ -1386,7 +1382,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
             log.debug(f"Interface id {interface_details['id']} loading "
                       f"{len(available_tags)} "
                       "available tags")
-            port_number = int(interface_details["id"].split(":")[-1])
+            port_number = int(interface_details["id"].rpartition(":")[2])
             interface = switch.interfaces[port_number]
             interface.set_available_tags_tag_ranges(
                 available_tags,
@@ -1398,8 +1394,7 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
     @listen_to('topology.interruption.start')
     def on_interruption_start(self, event: KytosEvent):
         """Deals with the start of service interruption."""
-        with self._links_lock:
-            self.handle_interruption_start(event)
+        self.handle_interruption_start(event)
 
     def handle_interruption_start(self, event: KytosEvent):
         """Deals with the start of service interruption."""
@@ -1419,23 +1414,26 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
         #     pass
         # for interface_id in interfaces:
         #     pass
-        for link_id in links:
-            link = self.links.get(link_id)
-            if link is None:
-                log.error(
-                    "Invalid link id '%s' for interruption of type '%s;",
-                    link_id,
-                    interrupt_type
-                )
-            else:
-                self.notify_link_status_change(link, interrupt_type)
+        notify_links = []
+        with self._links_lock:
+            for link_id in links:
+                link = self.links.get(link_id)
+                if link is None:
+                    log.error(
+                        "Invalid link id '%s' for interruption of type '%s;",
+                        link_id,
+                        interrupt_type
+                    )
+                else:
+                    notify_links.append(link)
+        for link in notify_links:
+            self.notify_link_status_change(link, interrupt_type)
         self.notify_topology_update()
 
     @listen_to('topology.interruption.end')
     def on_interruption_end(self, event: KytosEvent):
         """Deals with the end of service interruption."""
-        with self._links_lock:
-            self.handle_interruption_end(event)
+        self.handle_interruption_end(event)
 
     def handle_interruption_end(self, event: KytosEvent):
         """Deals with the end of service interruption."""
@@ -1455,14 +1453,18 @@ class Main(KytosNApp):  # pylint: disable=too-many-public-methods
         #     pass
         # for interface_id in interfaces:
         #     pass
-        for link_id in links:
-            link = self.links.get(link_id)
-            if link is None:
-                log.error(
-                    "Invalid link id '%s' for interruption of type '%s;",
-                    link_id,
-                    interrupt_type
-                )
-            else:
-                self.notify_link_status_change(link, interrupt_type)
+        notify_links = []
+        with self._links_lock:
+            for link_id in links:
+                link = self.links.get(link_id)
+                if link is None:
+                    log.error(
+                        "Invalid link id '%s' for interruption of type '%s;",
+                        link_id,
+                        interrupt_type
+                    )
+                else:
+                    notify_links.append(link)
+        for link in notify_links:
+            self.notify_link_status_change(link, interrupt_type)
         self.notify_topology_update()
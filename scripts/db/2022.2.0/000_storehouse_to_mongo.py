@@ -2,16 +2,17 @@
 # -*- coding: utf-8 -*-
 
 import json
-import glob
 import pickle
 import os
 import sys
-from typing import Any, List, Tuple
+from typing import Any, Callable, List, Tuple
 from napps.kytos.topology.controllers import TopoController
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 topo_controller = TopoController()
 
+MAX_WORKERS = 16
+
 
 def get_storehouse_dir() -> str:
     return os.environ["STOREHOUSE_NAMESPACES_DIR"]
@@ -21,10 +22,18 @@ def _list_boxes_files(namespace: str, storehouse_dir=get_storehouse_dir()) -> di
     """List boxes files given the storehouse dir."""
     if storehouse_dir.endswith(os.path.sep):
         storehouse_dir = storehouse_dir[:-1]
-    return {
-        file_name.split(os.path.sep)[-2]: file_name
-        for file_name in glob.glob(f"{storehouse_dir}/{namespace}**/*", recursive=True)
-    }
+    if not os.path.isdir(storehouse_dir):
+        return {}
+    boxes_files = {}
+    with os.scandir(storehouse_dir) as entries:
+        for entry in entries:
+            if not entry.name.startswith(namespace) or not entry.is_dir():
+                continue
+            with os.scandir(entry.path) as files:
+                for file in files:
+                    if not file.name.startswith("."):
+                        boxes_files[entry.name] = file.path
+    return boxes_files
 
 
 def _load_from_file(file_name) -> Any:
@@ -32,9 +41,28 @@ def _load_from_file(file_name) -> Any:
         return pickle.load(load_file)
 
 
+def _submit_all(func: Callable, args_list: List[tuple]) -> List[Any]:
+    """Call func with each args in a bounded thread pool."""
+    if not args_list:
+        return []
+    responses = []
+    max_workers = min(len(args_list), MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, *args) for args in args_list]
+        for future in as_completed(futures):
+            responses.append(future.result())
+    return responses
+
+
+def _load_box(box_id: str, file_name: str) -> Tuple[str, Any]:
+    """Load a box data keeping its id."""
+    return box_id, _load_from_file(file_name).data
+
+
 def load_boxes_data(namespace: str) -> dict:
     """Load boxes data."""
-    return {k: _load_from_file(v).data for k, v in _list_boxes_files(namespace).items()}
+    boxes_files = _list_boxes_files(namespace)
+    return dict(_submit_all(_load_box, list(boxes_files.items())))
 
 
 def load_topology_status() -> Tuple[List[dict], List[dict]]:
@@ -72,26 +100,14 @@ def insert_from_topology_status(
     """Insert from topology status."""
     loaded_switches, loaded_links = load_topology_status()
 
-    insert_switches = []
-    with ThreadPoolExecutor(max_workers=len(loaded_switches)) as executor:
-        futures = [
-            executor.submit(topo_controller.upsert_switch, switch["id"], switch)
-            for switch in loaded_switches
-        ]
-        for future in as_completed(futures):
-            response = future.result()
-            insert_switches.append(response)
-
-    insert_links = []
-    with ThreadPoolExecutor(max_workers=len(loaded_links)) as executor:
-        futures = [
-            executor.submit(topo_controller.upsert_link, link["id"], link)
-            for link in loaded_links
-        ]
-        for future in as_completed(futures):
-            response = future.result()
-            insert_switches.append(response)
-
+    insert_switches = _submit_all(
+        topo_controller.upsert_switch,
+        [(switch["id"], switch) for switch in loaded_switches],
+    )
+    insert_links = _submit_all(
+        topo_controller.upsert_link,
+        [(link["id"], link) for link in loaded_links],
+    )
     return (insert_switches, insert_links)
 
 
@@ -110,16 +126,7 @@ def insert_from_topology_switches_metadata(
 ) -> List[dict]:
     """Insert from topology switches metadata namespace."""
     switches = load_topology_metadata("switches")
-    responses = []
-    with ThreadPoolExecutor(max_workers=len(switches)) as executor:
-        futures = [
-            executor.submit(topo_controller.add_switch_metadata, dpid, metadata)
-            for dpid, metadata in switches.items()
-        ]
-        for future in as_completed(futures):
-            response = future.result()
-            responses.append(response)
-    return responses
+    return _submit_all(topo_controller.add_switch_metadata, list(switches.items()))
 
 
 def insert_from_topology_interfaces_metadata(
@@ -127,33 +134,15 @@ def insert_from_topology_interfaces_metadata(
 ) -> List[dict]:
     """Insert from topology interfaces metadata namespace."""
     interfaces = load_topology_metadata("interfaces")
-    responses = []
-    with ThreadPoolExecutor(max_workers=len(interfaces)) as executor:
-        futures = [
-            executor.submit(
-                topo_controller.add_interface_metadata, interface_id, metadata
-            )
-            for interface_id, metadata in interfaces.items()
-        ]
-        for future in as_completed(futures):
-            response = future.result()
-            responses.append(response)
-    return responses
+    return _submit_all(
+        topo_controller.add_interface_metadata, list(interfaces.items())
+    )
 
 
 def insert_from_topology_links_metadata(topo_controller=topo_controller) -> List[dict]:
     """Insert from topology links metadata namespace."""
     links = load_topology_metadata("links")
-    responses = []
-    with ThreadPoolExecutor(max_workers=len(links)) as executor:
-        futures = [
-            executor.submit(topo_controller.add_link_metadata, link_id, metadata)
-            for link_id, metadata in links.items()
-        ]
-        for future in as_completed(futures):
-            response = future.result()
-            responses.append(response)
-    return responses
+    return _submit_all(topo_controller.add_link_metadata, list(links.items()))
 
 
 if __name__ == "__main__":
@@ -14,7 +14,14 @@ def unset_links(mongo: Mongo) -> None:
     )
     db = mongo.client[mongo.db_name]
     res = db.links.update_many(
-        {},
+        {
+            "$or": [
+                {"active": {"$exists": True}},
+                {"metadata.last_status_is_active": {"$exists": True}},
+                {"metadata.last_status_change": {"$exists": True}},
+                {"metadata.notified_up_at": {"$exists": True}},
+            ]
+        },
         {
             "$unset": {
                 "active": 1,
@@ -54,13 +61,19 @@ def unset_switches_and_intfs(mongo: Mongo) -> None:
     print("Trying to $unset switches and interfaces 'active'")
     db = mongo.client[mongo.db_name]
     res = db.switches.update_many(
-        {},
+        {
+            "$or": [
+                {"active": {"$exists": True}},
+                {"interfaces.active": {"$exists": True}},
+            ]
+        },
         {
             "$unset": {
                 "active": 1,
-                "interfaces.$[].active": 1,
+                "interfaces.$[intf].active": 1,
             }
         },
+        array_filters=[{"intf.active": {"$exists": True}}],
     )
     print(f"Modified {res.modified_count} switches objects")
 
@@ -3,29 +3,28 @@ import sys
 import os
 from collections import defaultdict
 from kytos.core.db import Mongo
+from pymongo.operations import InsertOne, UpdateOne
 
 DEFAULT_TAG_RANGES = [[1, 4095]]
+BULK_SIZE = 500
+
+def iter_uni_tags(evc):
+    """Yield (interface_id, tag value) from each EVC UNI with a TAG"""
+    for uni in (evc["uni_a"], evc["uni_z"]):
+        tag = uni.get("tag")
+        if tag:
+            yield uni["interface_id"], tag["value"]
 
 def get_range(vlans, avoid) -> list[list[int]]:
     """Convert available_vlans to available_tags.
     From list[int] to list[list[int]]"""
     result = []
-    if not vlans:
-        return result
-    vlans.sort()
-    i = 0
-    while i < len(vlans):
-        if vlans[i] in avoid:
-            i += 1
-        else:
-            break
-    if not vlans[i:]:
+    tags = iter(sorted(set(vlans).difference(avoid)))
+    start = end = next(tags, None)
+    if start is None:
         return result
 
-    start = end = vlans[i]
-    for tag in vlans[i+1:]:
-        if tag in avoid:
-            continue
+    for tag in tags:
         if tag == end + 1:
             end = tag
         else:
@@ -39,11 +38,10 @@ def generate_ranges(avoid) -> [list[list[int]]]:
     if not avoid:
         return DEFAULT_TAG_RANGES
 
-    avoid.sort()
     ranges = []
     start = 1
 
-    for num in avoid:
+    for num in sorted(avoid):
         if num > start:
             ranges.append([start, num - 1])
         start = num + 1
@@ -52,46 +50,56 @@ def generate_ranges(avoid) -> [list[list[int]]]:
         ranges.append([start, 4095])
     return ranges
 
-def update_database(mongo: Mongo):
-    """Update database"""
-    db = mongo.client[mongo.db_name]
-    intf_documents = db.interface_details.find()
-    evc_documents = db.evcs.find({"archived": False})
-
+def get_evc_tags(db, strict: bool) -> defaultdict:
+    """Get the TAG values used per interface by not archived EVCs.
+    A duplicated TAG exits when strict, otherwise it is only warned."""
     evc_intf = defaultdict(str)
     evc_tags = defaultdict(set)
 
+    evc_documents = db.evcs.find(
+        {"archived": False},
+        {
+            "_id": 0,
+            "id": 1,
+            "uni_a.interface_id": 1,
+            "uni_a.tag": 1,
+            "uni_z.interface_id": 1,
+            "uni_z.tag": 1,
+        },
+    ).batch_size(1000)
     for evc in evc_documents:
-        tag_a = evc["uni_a"].get("tag")
-        if tag_a:
-            intf_id = evc["uni_a"]["interface_id"]
-            if tag_a["value"] in evc_tags[intf_id] and isinstance(tag_a["value"], int):
-                print(f"Error: Detected duplicated {tag_a['value']} TAG"
-                      f" in EVCs {evc['id']} and {evc_intf[intf_id+str(tag_a['value'])]}"
+        for intf_id, tag_value in iter_uni_tags(evc):
+            if tag_value in evc_tags[intf_id] and isinstance(tag_value, int):
+                print(f"{'Error' if strict else 'WARNING'}: Detected"
+                      f" duplicated {tag_value} TAG in EVCs {evc['id']} and"
+                      f" {evc_intf[(intf_id, tag_value)]}"
                       f" in interface {intf_id}")
-                sys.exit(1)
-            evc_tags[intf_id].add(tag_a["value"])
-            evc_intf[intf_id+str(tag_a["value"])] = evc["id"]
-
-        tag_z = evc["uni_z"].get("tag")
-        if tag_z:
-            intf_id = evc["uni_z"]["interface_id"]
-            if tag_z["value"] in evc_tags[intf_id] and isinstance(tag_z["value"], int):
-                print(f"Error: Detected duplicated {tag_z['value']} TAG"
-                      f" in EVCs {evc['id']} and {evc_intf[intf_id+str(tag_z['value'])]}"
-                      f" in interface {intf_id}")
-                sys.exit(1)
-            evc_tags[intf_id].add(tag_z["value"])
-            evc_intf[intf_id+str(tag_z["value"])] = evc["id"]
+                if strict:
+                    sys.exit(1)
+                print()
+            evc_tags[intf_id].add(tag_value)
+            evc_intf[(intf_id, tag_value)] = evc["id"]
+    return evc_tags
+
+def update_database(mongo: Mongo):
+    """Update database"""
+    db = mongo.client[mongo.db_name]
+    intf_documents = db.interface_details.find(
+        {"available_vlans": {"$ne": None}},
+        {"_id": 0, "id": 1, "available_vlans": 1},
+    ).batch_size(1000)
+    evc_tags = get_evc_tags(db, strict=True)
+    existing_ids = set(db.interface_details.distinct(
+        "_id", {"_id": {"$in": list(evc_tags)}}
+    ))
 
     intf_count = 0
+    ops = []
     for document in intf_documents:
-        avoid_tags = evc_tags.pop(document["id"], set())
-        if document.get("available_vlans") is None:
-            continue
+        avoid_tags = evc_tags.get(document["id"], set())
         ranges = get_range(document["available_vlans"], avoid_tags)
-        result = db.interface_details.update_one(
-            {"id": document["id"]},
+        ops.append(UpdateOne(
+            {"_id": document["id"]},
             {
                 "$set": 
                 {
@@ -100,97 +108,86 @@ def update_database(mongo: Mongo):
                 },
                 "$unset": {"available_vlans": ""}
             }
-        )
-        intf_count += result.modified_count
+        ))
+        if len(ops) == BULK_SIZE:
+            intf_count += db.interface_details.bulk_write(
+                ops, ordered=False
+            ).modified_count
+            ops.clear()
+    if ops:
+        intf_count += db.interface_details.bulk_write(
+            ops, ordered=False
+        ).modified_count
+        ops.clear()
 
     evc_intf_count = 0
+    utc_now = datetime.datetime.utcnow()
     for intf_id, avoid_tags in evc_tags.items():
-        available_tags = generate_ranges(list(avoid_tags))
-        utc_now = datetime.datetime.utcnow()
-        result = db.interface_details.insert_one({
+        if intf_id in existing_ids:
+            continue
+        available_tags = generate_ranges(avoid_tags)
+        ops.append(InsertOne({
             "_id": intf_id,
             "id": intf_id,
             "inserted_at": utc_now,
             "updated_at": utc_now,
             "available_tags": {"vlan": available_tags},
             "tag_ranges": {"vlan": DEFAULT_TAG_RANGES},
-        })
-        if result:
-            evc_intf_count += 1
+        }))
+        if len(ops) == BULK_SIZE:
+            evc_intf_count += db.interface_details.bulk_write(
+                ops, ordered=False
+            ).inserted_count
+            ops.clear()
+    if ops:
+        evc_intf_count += db.interface_details.bulk_write(
+            ops, ordered=False
+        ).inserted_count
 
     print(f"{intf_count} documents modified. {evc_intf_count} documents inserted")
 
 def aggregate_outdated_interfaces(mongo: Mongo):
     """Aggregate outdated inteface details"""
     db = mongo.client[mongo.db_name]
-    document_ids = set()
     result = db.interface_details.aggregate(
         [
+            {"$match": {"available_vlans": {"$ne": None}}},
             {"$sort": {"_id": 1}},
             {"$project": {
                 "_id": 0,
                 "id": 1,
                 "max_number": {"$max": "$available_vlans"}, # MAX deleted in 6.0
                 "min_number": {"$min": "$available_vlans"}, # MIN deleted in 6.0
-                "available_vlans": 1,
             }}
         ]
     )
     
-    messages = ""
-    for document in result:
-        document_ids.add(document["id"])
-        if document.get("available_vlans") is None:
-            continue
-        document.pop("available_vlans")
-        messages += str(document) + "\n"
+    messages = [str(document) for document in result]
 
-    if messages != "":
+    if messages:
         print("Here are the outdated interfaces. 'available_vlans' have a massive"
           " amount of items, minimum and maximum items will be shown only")
-        print(messages)
+        print("\n".join(messages) + "\n")
     
-    evc_documents = db.evcs.find({"archived": False})
-    evc_intf = defaultdict(str)
-    evc_tags = defaultdict(set)
-
-    for evc in evc_documents:
-        tag_a = evc["uni_a"].get("tag")
-        if tag_a:
-            intf_id = evc["uni_a"]["interface_id"]
-            if tag_a["value"] in evc_tags[intf_id] and isinstance(tag_a["value"], int):
-                print(f"WARNING: Detected duplicated {tag_a['value']} TAG"
-                      f" in EVCs {evc['id']} and {evc_intf[intf_id+str(tag_a['value'])]}"
-                      f" in interface {intf_id}")
-                print()
-            evc_tags[intf_id].add(tag_a["value"])
-            evc_intf[intf_id+str(tag_a["value"])] = evc["id"]
-
-        tag_z = evc["uni_z"].get("tag")
-        if tag_z:
-            intf_id = evc["uni_z"]["interface_id"]
-            if tag_z["value"] in evc_tags[intf_id] and isinstance(tag_z["value"], int):
-                print(f"WARNING: Detected duplicated {tag_z['value']} TAG"
-                      f" in EVCs {evc['id']} and {evc_intf[intf_id+str(tag_z['value'])]}"
-                      f" in interface {intf_id}")
-                print()
-            evc_tags[intf_id].add(tag_z["value"])
-            evc_intf[intf_id+str(tag_z["value"])] = evc["id"]
-
-    for id_ in document_ids:
-        evc_tags.pop(id_, None)
+    evc_tags = get_evc_tags(db, strict=False)
+    existing_ids = set(db.interface_details.distinct(
+        "_id", {"_id": {"$in": list(evc_tags)}}
+    ))
+    evc_tags = {
+        intf_id: tags
+        for intf_id, tags in evc_tags.items()
+        if intf_id not in existing_ids
+    }
 
     if evc_tags:
         print("New documents are going to be created. From the next interfaces,"
               " these tags should be avoided")
 
     for intf, avoid_tags in evc_tags.items():
-        if intf in document_ids:
-            continue
         aux = {"id": intf, "avoid_tags": avoid_tags}
         print(aux)
 
-    if not evc_tags and messages == "":
+    if not evc_tags and not messages:
         print("There is nothing to update or add")
 
 
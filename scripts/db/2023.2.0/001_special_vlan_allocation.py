@@ -3,25 +3,33 @@ import sys
 import os
 from collections import defaultdict
 from kytos.core.db import Mongo
+from pymongo.operations import UpdateOne
+
+BULK_SIZE = 500
+DEFAULT_SPECIAL_VLANS = frozenset(("untagged", "any"))
+
+
+def iter_uni_tags(evc):
+    """Yield (interface_id, tag value) from each EVC UNI with a TAG"""
+    for uni in (evc["uni_a"], evc["uni_z"]):
+        tag = uni.get("tag")
+        if tag:
+            yield uni["interface_id"], tag["value"]
 
 
 def aggregate_outdated_interfaces(mongo: Mongo):
     """Aggregate outdated interfaces details"""
     db = mongo.client[mongo.db_name]
-    outdated_intfs = set()
-    result = db.interface_details.aggregate(
-        [
-            {"$project": {
-                "_id": 0,
-                "id": 1,
-                "special_available_tags": 1,
-            }}
-        ]
+    result = db.interface_details.find(
+        {
+            "$or": [
+                {"special_available_tags": {"$exists": False}},
+                {"special_tags": {"$exists": False}},
+            ]
+        },
+        {"_id": 0, "id": 1},
     )
-    for document in result:
-        if (not "special_available_tags" in document or
-                not "special_tags" in document):
-            outdated_intfs.add(document["id"])
+    outdated_intfs = {document["id"] for document in result}
     
     if outdated_intfs:
         print(f"There are {len(outdated_intfs)} outdated interface documents"
@@ -34,48 +42,52 @@ def aggregate_outdated_interfaces(mongo: Mongo):
 
 def update_database(mongo: Mongo):
     db = mongo.client[mongo.db_name]
-    intfs_documents = db.interface_details.find()
-    evc_documents = db.evcs.find({"archived": False})
+    intfs_documents = db.interface_details.find(
+        {},
+        {"_id": 0, "id": 1, "special_available_tags": 1, "special_tags": 1},
+    ).batch_size(1000)
+    evc_documents = db.evcs.find(
+        {"archived": False},
+        {
+            "_id": 0,
+            "id": 1,
+            "uni_a.interface_id": 1,
+            "uni_a.tag": 1,
+            "uni_z.interface_id": 1,
+            "uni_z.tag": 1,
+        },
+    ).batch_size(1000)
 
     tag_by_intf = defaultdict(set)
     evc_intf = defaultdict(str)
 
     for evc in evc_documents:
-        tag_a = evc["uni_a"].get("tag")
-        if tag_a and isinstance(tag_a["value"], str):
-            intf_id = evc["uni_a"]["interface_id"]
-            if tag_a["value"] in tag_by_intf[intf_id]:
-                print(f"Error: Detected duplicated vlan '{tag_a['value']}' TAG"
-                      f" in EVCs {evc['id']} and {evc_intf[intf_id+tag_a['value']]}"
+        for intf_id, tag_value in iter_uni_tags(evc):
+            if not isinstance(tag_value, str):
+                continue
+            if tag_value in tag_by_intf[intf_id]:
+                print(f"Error: Detected duplicated vlan '{tag_value}' TAG"
+                      f" in EVCs {evc['id']} and {evc_intf[(intf_id, tag_value)]}"
                       f" in interface {intf_id}")
                 sys.exit(1)
-            tag_by_intf[intf_id].add(tag_a["value"])
-            evc_intf[intf_id+tag_a["value"]] = evc["id"]
-        tag_z = evc["uni_z"].get("tag")
+            tag_by_intf[intf_id].add(tag_value)
+            evc_intf[(intf_id, tag_value)] = evc["id"]
 
-        if tag_z and isinstance(tag_z["value"], str):
-            intf_id = evc["uni_z"]["interface_id"]
-            if tag_z["value"] in tag_by_intf[intf_id]:
-                print(f"Error: Detected duplicated vlan '{tag_z['value']}' TAG"
-                      f" in EVCs {evc['id']} and {evc_intf[intf_id+tag_z['value']]}"
-                      f" in interface {intf_id}")
-                sys.exit(1)
-            tag_by_intf[intf_id].add(tag_z["value"])
-            evc_intf[intf_id+tag_z["value"]] = evc["id"]
-
-    default_special_vlans = {"untagged", "any"}
     intf_count = 0
-    message_intfs = ""
+    message_intfs = []
+    ops = []
     for intf in intfs_documents:
         _id = intf["id"]
         current_field = intf.get("special_available_tags", None)
         if current_field:
             current_field = set(current_field["vlan"])
-        expected_field = default_special_vlans - tag_by_intf.get(_id, set())
+        expected_field = DEFAULT_SPECIAL_VLANS
+        if _id in tag_by_intf:
+            expected_field = expected_field - tag_by_intf[_id]
         if current_field == expected_field and intf.get("special_tags"):
             continue
-        db.interface_details.update_one(
-            {"id": _id},
+        ops.append(UpdateOne(
+            {"_id": _id},
             {
                 "$set":
                 {
@@ -83,12 +95,17 @@ def update_database(mongo: Mongo):
                     "special_tags": {"vlan": ["untagged", "any"]}
                 }
             }
-        )
-        message_intfs += f"{_id}\n"
+        ))
+        message_intfs.append(_id)
         intf_count += 1
+        if len(ops) == BULK_SIZE:
+            db.interface_details.bulk_write(ops, ordered=False)
+            ops.clear()
+    if ops:
+        db.interface_details.bulk_write(ops, ordered=False)
     if intf_count:
         print(f"{intf_count} interface was/were updated:")
-        print(message_intfs)
+        print("\n".join(message_intfs) + "\n")
     else:
         print("All interfaces are updated already.")
 
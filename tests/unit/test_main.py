@@ -14,6 +14,7 @@ from kytos.core.exceptions import (KytosSetTagRangeError,
                                    KytosTagtypeNotSupported)
 from kytos.core.interface import Interface
 from kytos.core.link import Link
+from kytos.core.rest_api import HTTPException
 from kytos.core.switch import Switch
 from kytos.lib.helpers import (get_interface_mock, get_link_mock,
                                get_controller_mock, get_switch_mock,
@@ -125,6 +126,48 @@ class TestMain:
         response = self.napp._get_link_from_interface(mock_interface_c)
         assert not response
 
+    def test_get_interface(self):
+        """Test _get_interface."""
+        dpid = "00:00:00:00:00:00:00:01"
+        intf_id = f"{dpid}:1"
+        mock_switch = get_switch_mock(dpid, 0x04)
+        mock_interface = get_interface_mock('s1-eth1', 1, mock_switch)
+        mock_switch.interfaces = {1: mock_interface}
+
+        with pytest.raises(HTTPException) as exc:
+            self.napp._get_interface(f"{dpid}:x")
+        assert exc.value.status_code == 400
+
+        with pytest.raises(HTTPException) as exc:
+            self.napp._get_interface(intf_id)
+        assert exc.value.status_code == 404
+
+        self.napp.controller.switches = {dpid: mock_switch}
+        with pytest.raises(HTTPException) as exc:
+            self.napp._get_interface(f"{dpid}:2")
+        assert exc.value.status_code == 404
+
+        assert self.napp._get_interface(intf_id) == mock_interface
+        assert self.napp._intfs_by_id[intf_id] == mock_interface
+
+        new_interface = get_interface_mock('s1-eth1', 1, mock_switch)
+        mock_switch.interfaces = {1: new_interface}
+        assert self.napp._get_interface(intf_id) == new_interface
+        assert self.napp._intfs_by_id[intf_id] == new_interface
+
+        new_switch = get_switch_mock(dpid, 0x04)
+        new_switch_interface = get_interface_mock('s1-eth1', 1, new_switch)
+        new_switch.interfaces = {1: new_switch_interface}
+        self.napp.controller.switches = {dpid: new_switch}
+        assert self.napp._get_interface(intf_id) == new_switch_interface
+        assert self.napp._intfs_by_id[intf_id] == new_switch_interface
+
+        self.napp.controller.switches = {}
+        with pytest.raises(HTTPException) as exc:
+            self.napp._get_interface(intf_id)
+        assert exc.value.status_code == 404
+        assert intf_id not in self.napp._intfs_by_id
+
     async def test_get_topology(self):
         """Test get_topology."""
         dpid_a = "00:00:00:00:00:00:00:01"
@@ -177,6 +220,28 @@ class TestMain:
         assert response.status_code == 200
         assert response.json() == expected
 
+    async def test_get_interfaces(self):
+        """Test get_interfaces."""
+        dpid_a = "00:00:00:00:00:00:00:01"
+        mock_switch_a = get_switch_mock(dpid_a, 0x04)
+        mock_interface_a = get_interface_mock('s1-eth1', 1, mock_switch_a)
+        mock_interface_b = get_interface_mock('s1-eth2', 2, mock_switch_a)
+        mock_interface_a.as_dict.return_value = {"id": mock_interface_a.id}
+        mock_interface_b.as_dict.return_value = {"id": mock_interface_b.id}
+        mock_switch_a.interfaces = {1: mock_interface_a, 2: mock_interface_b}
+        self.napp.controller.switches = {dpid_a: mock_switch_a}
+
+        endpoint = f"{self.base_endpoint}/interfaces"
+        response = await self.api_client.get(endpoint)
+        assert response.status_code == 200
+        assert response.json() == {
+            "interfaces": {
+                f"{dpid_a}:1": {"id": f"{dpid_a}:1"},
+                f"{dpid_a}:2": {"id": f"{dpid_a}:2"},
+            }
+        }
+        mock_switch_a.as_dict.assert_not_called()
+
     def test_load_topology(self):
         """Test load_topology."""
         mock_buffers_put = MagicMock()
@@ -243,6 +308,15 @@ class TestMain:
         assert links_expected == list(self.napp.links.keys())
         assert mock_buffers_put.call_args[1] == {"timeout": 1}
 
+        switch_events = [
+            call_args[0][0].content["switch"].id
+            for call_args in mock_buffers_put.call_args_list
+            if call_args[0][0].name in (
+                "kytos/core.switch.new", "kytos/core.switch.reconnected"
+            )
+        ]
+        assert sorted(switch_events) == switches_expected
+
     @patch('napps.kytos.topology.main.Main._load_switch')
     @patch('napps.kytos.topology.main.Main._load_link')
     def test_load_topology_does_nothing(self, *args):
@@ -354,6 +428,7 @@ class TestMain:
         assert interface.lldp
         assert interface.uni
         assert not interface.nni
+        assert self.napp._intfs_by_id[iface_a] == interface
 
     def test_load_switch_attrs(self):
         """Test _load_switch."""
@@ -764,9 +839,13 @@ class TestMain:
 
         mock_interface_1.enable.call_count = 0
         mock_interface_2.enable.call_count = 0
+        self.napp.notify_switch_links_status = MagicMock()
         endpoint = f"{self.base_endpoint}/interfaces/switch/{dpid}/enable"
         response = await self.api_client.post(endpoint)
         assert response.status_code == 200
+        self.napp.notify_switch_links_status.assert_called_once_with(
+            mock_switch, "link enabled"
+        )
         self.napp.topo_controller.upsert_switch.assert_called_with(
             mock_switch.id, mock_switch.as_dict()
         )
@@ -825,10 +904,14 @@ class TestMain:
 
         mock_interface_1.disable.call_count = 0
         mock_interface_2.disable.call_count = 0
+        self.napp.notify_switch_links_status = MagicMock()
 
         endpoint = f"{self.base_endpoint}/interfaces/switch/{dpid}/disable"
         response = await self.api_client.post(endpoint)
         assert response.status_code == 200
+        self.napp.notify_switch_links_status.assert_called_once_with(
+            mock_switch, "link disabled"
+        )
 
         self.napp.topo_controller.upsert_switch.assert_called_with(
             mock_switch.id, mock_switch.as_dict()
@@ -1059,6 +1142,33 @@ class TestMain:
         mock_put = self.napp.controller.buffers.app.put
         assert mock_put.call_count == len(interface_ids)
 
+        # pending upserts are coalesced until they get handled
+        self.napp.handle_lldp_status_updated(event)
+        assert mock_put.call_count == len(interface_ids)
+
+        self.napp.handle_topo_controller_upsert_switch(mock_switch_a)
+        self.napp.handle_lldp_status_updated(event)
+        assert mock_put.call_count == len(interface_ids) + 1
+
+    def test_handle_lldp_status_updated_put_error(self):
+        """Test handle_lldp_status_updated when the event can't be put."""
+        event = MagicMock()
+        dpid = "00:00:00:00:00:00:00:01"
+        mock_switch = get_switch_mock(dpid, 0x04)
+        self.napp.controller.switches = {dpid: mock_switch}
+        event.content = {"interface_ids": [f"{dpid}:1"], "state": "disabled"}
+
+        mock_put = MagicMock(side_effect=RuntimeError("full"))
+        self.napp.controller.buffers.app.put = mock_put
+        with pytest.raises(RuntimeError):
+            self.napp.handle_lldp_status_updated(event)
+        assert dpid not in self.napp._switches_upsert_pending
+
+        mock_put.side_effect = None
+        self.napp.handle_lldp_status_updated(event)
+        assert mock_put.call_count == 2
+        assert dpid in self.napp._switches_upsert_pending
+
     def test_handle_topo_controller_upsert_switch(self):
         """Test handle_topo_controller_upsert_switch."""
         event = MagicMock()
@@ -1195,6 +1305,7 @@ class TestMain:
         self.napp.handle_interface_created(mock_event)
         mock_link_up.assert_called()
         mock_link_down.assert_not_called()
+        assert self.napp._intfs_by_id["1"] == mock_interface
 
     @patch('napps.kytos.topology.main.Main.handle_interface_link_down')
     @patch('napps.kytos.topology.main.Main.handle_interface_link_up')
@@ -1227,6 +1338,8 @@ class TestMain:
         upsert_mock = self.napp.topo_controller.upsert_switch
         upsert_mock.assert_called_with(mock_switch.id, mock_switch.as_dict())
         assert self.napp.controller.buffers.app.put.call_count == 2
+        assert self.napp._intfs_by_id == {"1": mock_interface,
+                                          "2": mock_interface_two}
 
     @patch('napps.kytos.topology.main.Main.handle_interface_link_down')
     def test_handle_interface_down(self, mock_handle_interface_link_down):
@@ -1533,6 +1646,24 @@ class TestMain:
         response = self.napp.get_links_from_interfaces(interfaces[:2])
         assert response == {"link1": links["link1"]}
 
+    @patch('napps.kytos.topology.main.Link')
+    def test_on_link_liveness_status(self, mock_link_cls) -> None:
+        """Test on_link_liveness_status."""
+        self.napp.handle_link_liveness_status = MagicMock()
+        mock_link_cls.return_value = MagicMock(id="link1")
+        event = KytosEvent("kytos/of_lldp.liveness.up",
+                           {"interface_a": MagicMock(),
+                            "interface_b": MagicMock()})
+
+        self.napp.on_link_liveness_status(event)
+        assert self.napp.handle_link_liveness_status.call_count == 0
+
+        link = MagicMock(id="link1")
+        self.napp.links = {"link1": link}
+        self.napp.on_link_liveness_status(event)
+        self.napp.handle_link_liveness_status.assert_called_once_with(link,
+                                                                      "up")
+
     def test_handle_link_liveness_disabled(self) -> None:
         """Test handle_link_liveness_disabled."""
         interfaces = [MagicMock(id=f"intf{n}") for n in range(4)]
@@ -1619,6 +1750,22 @@ class TestMain:
         self.napp.notify_switch_links_status(mock_switch, "link enabled")
         assert self.napp.controller.buffers.app.put.call_count == 1
 
+    def test_notify_switch_links_status_releases_lock(self):
+        """Test switch links events are put without holding _links_lock."""
+        self.napp.controller.buffers.app = MagicMock()
+        dpid = "00:00:00:00:00:00:00:01"
+        mock_switch = get_switch_mock(dpid)
+        link1 = MagicMock()
+        link1.endpoint_a.switch = mock_switch
+        self.napp.links = {1: link1}
+        locked = []
+        self.napp.controller.buffers.app.put.side_effect = (
+            lambda _: locked.append(self.napp._links_lock.locked())
+        )
+
+        self.napp.notify_switch_links_status(mock_switch, "link enabled")
+        assert locked == [False]
+
     @patch('napps.kytos.topology.main.Main.notify_link_status_change')
     @patch('napps.kytos.topology.main.Main._get_link_from_interface')
     def test_notify_interface_link_status(self, *args):
@@ -2043,9 +2190,11 @@ class TestMain:
         # Success 202
         mock_get.return_value = {}
         self.napp.links = {}
+        self.napp._intfs_by_id[mock_intf.id] = mock_intf
         endpoint = f"{self.base_endpoint}/switches/{dpid}"
         response = await self.api_client.delete(endpoint)
         assert response.status_code == 200, response
+        assert mock_intf.id not in self.napp._intfs_by_id
 
     def test_notify_link_status(self):
         """Test notify_link_enabled_state"""
@@ -2194,7 +2343,9 @@ class TestMain:
         switch_id = "00:00:00:00:00:00:00:01"
         mock_switch = get_switch_mock(switch_id)
         mock_intf = get_interface_mock('s1-eth1', 1, mock_switch)
+        self.napp._intfs_by_id[mock_intf.id] = mock_intf
         self.napp._delete_interface(mock_intf)
+        assert mock_intf.id not in self.napp._intfs_by_id
         assert mock_switch.remove_interface.call_count == 1
         assert self.napp.topo_controller.upsert_switch.call_count == 1
         delete = self.napp.topo_controller.delete_interface_from_details